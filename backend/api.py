@@ -1,18 +1,36 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from pydantic import BaseModel
-import pandas as pd
+from pydantic import BaseModel, ConfigDict, computed_field
+from cachetools import TTLCache
+import numpy as np
 from datetime import datetime
-import json
+import hashlib
+import orjson
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import os
 
 from database.database import get_db, init_database
-from database.models import Employee, JobRole, Skill, EmployeeSkill, JobRecommendation
+from database.models import Employee
 from ml_models.model_trainer import ModelPredictor
-from config import JOB_ROLES, SKILL_CATEGORIES, SALARY_RANGES
+from backend.batching import AsyncBatcher
+from backend.caching import ShortTTLCache
+from config import (
+    JOB_ROLES, SKILL_CATEGORIES, SALARY_RANGES,
+    BATCH_MAX_SIZE, BATCH_MAX_LATENCY_MS, PREDICTION_CACHE_SIZE, PREDICTION_CACHE_TTL,
+    DASHBOARD_CACHE_TTL, EMPLOYEE_CACHE_TTL, STATIC_CACHE_MAX_AGE
+)
 
-app = FastAPI(title="Workforce Distribution AI API", version="1.0.0")
+app = FastAPI(
+    title="Workforce Distribution AI API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # CORS middleware
 app.add_middleware(
@@ -23,6 +41,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Education encoding and the per-level scoring factors, indexed by encoded value
+EDUCATION_MAP = MappingProxyType({"High School": 0, "Bachelors": 1, "Masters": 2, "PhD": 3})
+EDU_BONUS = (5, 15, 25, 30)  # Match-score points, High School to PhD
+EDU_MULTIPLIERS = (0.85, 1.0, 1.15, 1.3)  # Salary estimate multipliers, High School to PhD
+
 # Initialize ML predictor
 try:
     predictor = ModelPredictor()
@@ -30,6 +53,42 @@ except Exception as e:
     print(f"Warning: Could not load ML models: {e}")
     predictor = None
 
+# Per-endpoint micro-batchers, started with the event loop
+batchers = {}
+
+# Per-endpoint prediction caches, keyed on rounded input features
+prediction_caches = {
+    name: TTLCache(maxsize=PREDICTION_CACHE_SIZE, ttl=PREDICTION_CACHE_TTL)
+    for name in ('retention', 'salary', 'role', 'skill_rating')
+}
+cache_stats = {"hits": 0, "misses": 0}
+
+# Dashboard analytics tolerate a little staleness
+dashboard_cache = ShortTTLCache(ttl=DASHBOARD_CACHE_TTL, maxsize=1)
+
+# Short-lived cache for employee reads during dashboard render bursts, cleared on writes
+employee_read_cache = ShortTTLCache(ttl=EMPLOYEE_CACHE_TTL)
+
+# Role salary bounds as arrays in JOB_ROLES order, for vectorized scoring
+_SAL_MIN = np.array([SALARY_RANGES[role][0] for role in JOB_ROLES]) * 1000
+_SAL_MAX = np.array([SALARY_RANGES[role][1] for role in JOB_ROLES]) * 1000
+_SAL_AVG = (_SAL_MIN + _SAL_MAX) / 2
+
+# Static responses are encoded once, with a strong ETag so clients can revalidate
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+_ROOT_RESPONSE_JSON = orjson.dumps({"message": "Workforce Distribution AI API", "version": "1.0.0"})
+_ROOT_ETAG = _etag(_ROOT_RESPONSE_JSON)
+
+_SKILLS_RESPONSE = [
+    {"name": skill, "category": category}
+    for category, skills in SKILL_CATEGORIES.items()
+    for skill in skills
+]
+_SKILLS_RESPONSE_JSON = orjson.dumps(_SKILLS_RESPONSE)
+_SKILLS_ETAG = _etag(_SKILLS_RESPONSE_JSON)
+
 # Pydantic models
 class EmployeeCreate(BaseModel):
     name: str
@@ -46,6 +105,27 @@ class EmployeeCreate(BaseModel):
     location: str
     performance_rating: float
 
+class EmployeeOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int
+    name: str
+    email: str
+    age: Optional[int] = None
+    joining_year: Optional[int] = None
+    payment_tier: Optional[int] = None
+    experience_in_domain: Optional[int] = None
+    current_salary: Optional[float] = None
+    expected_salary: Optional[float] = None
+    education_level: Optional[str] = None
+    current_role: Optional[str] = None
+    department: Optional[str] = None
+    location: Optional[str] = None
+    performance_rating: Optional[float] = None
+    will_leave: Optional[bool] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
 class EmployeePrediction(BaseModel):
     age: int
     joining_year: int
@@ -55,6 +135,23 @@ class EmployeePrediction(BaseModel):
     expected_salary: float
     education_level: str
     performance_rating: float
+    
+    # Derived model features, included in model_dump()
+    @computed_field
+    @property
+    def education_encoded(self) -> int:
+        return EDUCATION_MAP.get(self.education_level, 1)
+    
+    @computed_field
+    @property
+    def annual_growth(self) -> float:
+        return self.expected_salary - self.current_salary
+    
+    @computed_field
+    @property
+    def salary_growth_rate(self) -> float:
+        # A zero salary has no growth rate; NaN lets the imputer fill it
+        return self.annual_growth / self.current_salary if self.current_salary else float('nan')
 
 class SkillRating(BaseModel):
     employee_id: int
@@ -72,40 +169,77 @@ class JobRecommendationResponse(BaseModel):
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup"""
+    """Initialize database, warm up models and start prediction batchers on startup"""
     init_database()
+    
+    # Batched inference runs via asyncio.to_thread; size its pool to the available cores
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=os.cpu_count()))
+    
+    if predictor:
+        try:
+            predictor.warmup()
+        except Exception as e:
+            print(f"Warning: Model warm-up failed: {e}")
+        
+        batchers['retention'] = AsyncBatcher(predictor.predict_retention, BATCH_MAX_SIZE, BATCH_MAX_LATENCY_MS)
+        batchers['salary'] = AsyncBatcher(predictor.predict_salary, BATCH_MAX_SIZE, BATCH_MAX_LATENCY_MS)
+        batchers['role'] = AsyncBatcher(predictor.predict_role, BATCH_MAX_SIZE, BATCH_MAX_LATENCY_MS)
+        batchers['skill_rating'] = AsyncBatcher(predictor.predict_skill_rating, BATCH_MAX_SIZE, BATCH_MAX_LATENCY_MS)
+        for batcher in batchers.values():
+            batcher.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop prediction batchers on shutdown"""
+    for batcher in batchers.values():
+        await batcher.stop()
+    batchers.clear()
 
 @app.get("/")
-async def root():
-    return {"message": "Workforce Distribution AI API", "version": "1.0.0"}
+async def root(request: Request):
+    return _static_json_response(request, _ROOT_RESPONSE_JSON, _ROOT_ETAG)
 
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "timestamp": datetime.now()}
 
 # Employee endpoints
+# Handlers doing blocking DB I/O are plain functions, so FastAPI runs them in its threadpool
 @app.post("/employees/", response_model=dict)
-async def create_employee(employee: EmployeeCreate, db: Session = Depends(get_db)):
+def create_employee(employee: EmployeeCreate, db: Session = Depends(get_db)):
     """Create a new employee"""
     db_employee = Employee(**employee.dict())
     db.add(db_employee)
     db.commit()
     db.refresh(db_employee)
+    employee_read_cache.clear()
     return {"id": db_employee.id, "message": "Employee created successfully"}
 
-@app.get("/employees/")
-async def get_employees(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@app.post("/employees/bulk", response_model=dict)
+def create_employees_bulk(employees: List[EmployeeCreate], db: Session = Depends(get_db)):
+    """Create many employees with a single multi-row INSERT and one commit"""
+    if employees:
+        db.execute(insert(Employee), [employee.model_dump() for employee in employees])
+        db.commit()
+        employee_read_cache.clear()
+    return {"created": len(employees), "message": "Employees created successfully"}
+
+@app.get("/employees/", response_model=List[EmployeeOut])
+@employee_read_cache.cached
+def get_employees(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     """Get list of employees"""
     employees = db.query(Employee).offset(skip).limit(limit).all()
-    return employees
+    # Cache detached schema objects rather than session-bound ORM rows
+    return [EmployeeOut.model_validate(employee) for employee in employees]
 
-@app.get("/employees/{employee_id}")
-async def get_employee(employee_id: int, db: Session = Depends(get_db)):
+@app.get("/employees/{employee_id}", response_model=EmployeeOut)
+@employee_read_cache.cached
+def get_employee(employee_id: int, db: Session = Depends(get_db)):
     """Get employee by ID"""
     employee = db.query(Employee).filter(Employee.id == employee_id).first()
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
-    return employee
+    return EmployeeOut.model_validate(employee)
 
 # Prediction endpoints
 @app.post("/predict/retention")
@@ -114,20 +248,10 @@ async def predict_retention(employee_data: EmployeePrediction):
     if not predictor:
         raise HTTPException(status_code=503, detail="ML models not available")
     
-    # Convert to dict and add derived features
-    data = employee_data.dict()
-    
-    # Add education encoding
-    education_map = {"High School": 0, "Bachelors": 1, "Masters": 2, "PhD": 3}
-    data['education_encoded'] = education_map.get(data['education_level'], 1)
-    
-    # Add derived features
-    data['annual_growth'] = data['expected_salary'] - data['current_salary']
-    data['salary_growth_rate'] = data['annual_growth'] / data['current_salary']
-    data['tenure'] = 2023 - data['joining_year']
+    data = employee_data.model_dump()
     
     try:
-        result = predictor.predict_retention(data)
+        result = await _cached_predict('retention', employee_data, data)
         return {
             "will_leave": result['will_leave'],
             "leave_probability": round(result['leave_probability'], 3),
@@ -143,15 +267,10 @@ async def predict_salary(employee_data: EmployeePrediction):
     if not predictor:
         raise HTTPException(status_code=503, detail="ML models not available")
     
-    data = employee_data.dict()
-    education_map = {"High School": 0, "Bachelors": 1, "Masters": 2, "PhD": 3}
-    data['education_encoded'] = education_map.get(data['education_level'], 1)
-    data['annual_growth'] = data['expected_salary'] - data['current_salary']
-    data['salary_growth_rate'] = data['annual_growth'] / data['current_salary']
-    data['tenure'] = 2023 - data['joining_year']
+    data = employee_data.model_dump()
     
     try:
-        predicted_salary = predictor.predict_salary(data)
+        predicted_salary = await _cached_predict('salary', employee_data, data)
         growth_amount = predicted_salary - data['current_salary']
         growth_percentage = (growth_amount / data['current_salary']) * 100
         
@@ -170,15 +289,10 @@ async def predict_role(employee_data: EmployeePrediction):
     if not predictor:
         raise HTTPException(status_code=503, detail="ML models not available")
     
-    data = employee_data.dict()
-    education_map = {"High School": 0, "Bachelors": 1, "Masters": 2, "PhD": 3}
-    data['education_encoded'] = education_map.get(data['education_level'], 1)
-    data['annual_growth'] = data['expected_salary'] - data['current_salary']
-    data['salary_growth_rate'] = data['annual_growth'] / data['current_salary']
-    data['tenure'] = 2023 - data['joining_year']
+    data = employee_data.model_dump()
     
     try:
-        result = predictor.predict_role(data)
+        result = await _cached_predict('role', employee_data, data)
         role_name = result['role']
         confidence = result['confidence']
         
@@ -203,12 +317,10 @@ async def predict_skill_rating(employee_data: EmployeePrediction):
     if not predictor:
         raise HTTPException(status_code=503, detail="ML models not available")
     
-    data = employee_data.dict()
-    education_map = {"High School": 0, "Bachelors": 1, "Masters": 2, "PhD": 3}
-    data['education_encoded'] = education_map.get(data['education_level'], 1)
+    data = employee_data.model_dump()
     
     try:
-        skill_rating = predictor.predict_skill_rating(data)
+        skill_rating = await _cached_predict('skill_rating', employee_data, data)
         
         # Categorize rating
         if skill_rating >= 8:
@@ -229,84 +341,86 @@ async def predict_skill_rating(employee_data: EmployeePrediction):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
 
+# Prediction cache admin
+@app.get("/admin/cache/stats")
+async def get_cache_stats():
+    """Get prediction cache hit rate and size"""
+    total = cache_stats['hits'] + cache_stats['misses']
+    return {
+        "hits": cache_stats['hits'],
+        "misses": cache_stats['misses'],
+        "hit_rate": round(cache_stats['hits'] / total, 3) if total else 0.0,
+        "entries": {name: len(cache) for name, cache in prediction_caches.items()}
+    }
+
+@app.post("/admin/cache/clear")
+async def clear_cache():
+    """Clear all cached predictions"""
+    for cache in prediction_caches.values():
+        cache.clear()
+    cache_stats['hits'] = cache_stats['misses'] = 0
+    return {"message": "Prediction cache cleared"}
+
 # Job recommendations
 @app.get("/job-roles/")
-async def get_job_roles():
+async def get_job_roles(request: Request):
     """Get all available job roles"""
-    roles_data = []
-    for role in JOB_ROLES:
-        salary_range = SALARY_RANGES.get(role, (50, 100))
-        roles_data.append({
-            "title": role,
-            "min_salary": salary_range[0] * 1000,
-            "max_salary": salary_range[1] * 1000,
-            "category": _get_role_category(role)
-        })
-    return roles_data
+    return _static_json_response(request, _JOB_ROLES_RESPONSE_JSON, _JOB_ROLES_ETAG)
 
 @app.post("/recommend-jobs")
 async def recommend_jobs(employee_data: EmployeePrediction, top_n: int = 5):
     """Get job recommendations for employee"""
-    data = employee_data.dict()
-    education_map = {"High School": 0, "Bachelors": 1, "Masters": 2, "PhD": 3}
-    data['education_encoded'] = education_map.get(data['education_level'], 1)
+    data = employee_data.model_dump()
     
-    recommendations = []
+    # Score every role at once, then keep the best N
+    match_scores = _calculate_match_scores(data)
+    salary_estimates = _estimate_salaries(data)
+    top_indices = _top_n_indices(match_scores, top_n)
     
-    for role in JOB_ROLES:
-        match_score = _calculate_match_score(data, role)
-        salary_estimate = _estimate_salary_for_role(data, role)
+    # Only the selected roles are formatted into response dicts
+    recommendations = []
+    for i in top_indices:
+        role = JOB_ROLES[i]
+        match_score = float(match_scores[i])
+        required_skills = _ROLE_REQUIRED_SKILLS[role]
         
         recommendations.append({
             "job_title": role,
             "match_score": match_score,
-            "salary_estimate": salary_estimate,
-            "required_skills": _get_required_skills(role),
-            "missing_skills": _get_missing_skills(data, role),
+            "salary_estimate": round(float(salary_estimates[i]), 2),
+            "required_skills": list(required_skills),
+            "missing_skills": _get_missing_skills(data, required_skills),
             "recommendation_reason": _get_recommendation_reason(data, role, match_score)
         })
     
-    # Sort by match score and return top N
-    recommendations.sort(key=lambda x: x['match_score'], reverse=True)
-    return recommendations[:top_n]
+    return recommendations
 
 @app.get("/skills/")
-async def get_skills():
+async def get_skills(request: Request):
     """Get all available skills"""
-    skills_data = []
-    for category, skills in SKILL_CATEGORIES.items():
-        for skill in skills:
-            skills_data.append({
-                "name": skill,
-                "category": category
-            })
-    return skills_data
+    return _static_json_response(request, _SKILLS_RESPONSE_JSON, _SKILLS_ETAG)
 
 @app.get("/analytics/dashboard")
-async def get_dashboard_data(db: Session = Depends(get_db)):
+@dashboard_cache.cached
+def get_dashboard_data(db: Session = Depends(get_db)):
     """Get analytics data for dashboard"""
-    total_employees = db.query(Employee).count()
+    # Role distribution and average salary by role in one aggregation;
+    # the per-role counts also sum to the headcount, so no separate COUNT(*) scan
+    role_stats = db.query(
+        Employee.current_role,
+        func.count(Employee.id),
+        func.avg(func.nullif(Employee.current_salary, 0))
+    ).group_by(Employee.current_role).all()
     
-    # Role distribution
-    role_query = db.query(Employee.current_role).all()
+    total_employees = 0
     role_distribution = {}
-    for role in role_query:
-        role_name = role[0] if role[0] else "Unknown"
-        role_distribution[role_name] = role_distribution.get(role_name, 0) + 1
-    
-    # Average salary by role
-    salary_query = db.query(Employee.current_role, Employee.current_salary).all()
-    salary_by_role = {}
-    for role, salary in salary_query:
-        if role and salary:
-            if role not in salary_by_role:
-                salary_by_role[role] = []
-            salary_by_role[role].append(salary)
-    
-    avg_salary_by_role = {
-        role: sum(salaries) / len(salaries) 
-        for role, salaries in salary_by_role.items()
-    }
+    avg_salary_by_role = {}
+    for role, count, avg_salary in role_stats:
+        total_employees += count
+        role_name = role if role else "Unknown"
+        role_distribution[role_name] = role_distribution.get(role_name, 0) + count
+        if role and avg_salary is not None:
+            avg_salary_by_role[role] = avg_salary
     
     return {
         "total_employees": total_employees,
@@ -317,6 +431,46 @@ async def get_dashboard_data(db: Session = Depends(get_db)):
     }
 
 # Helper functions
+def _static_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve a precomputed JSON body, answering a matching If-None-Match with 304"""
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={STATIC_CACHE_MAX_AGE}"}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _prediction_key(employee_data: EmployeePrediction) -> tuple:
+    """Build a hashable cache key from prediction inputs, rounding noisy floats"""
+    return (
+        employee_data.age,
+        employee_data.joining_year,
+        employee_data.payment_tier,
+        employee_data.experience_in_domain,
+        round(employee_data.current_salary, -2),
+        round(employee_data.expected_salary, -2),
+        employee_data.education_level,
+        round(employee_data.performance_rating, 1)
+    )
+
+async def _cached_predict(model_name: str, employee_data: EmployeePrediction, data: dict):
+    """Return a cached prediction, or run it through the model's batcher"""
+    cache = prediction_caches[model_name]
+    key = _prediction_key(employee_data)
+    
+    result = cache.get(key)
+    if result is not None:
+        cache_stats['hits'] += 1
+        return result
+    
+    cache_stats['misses'] += 1
+    result = await batchers[model_name].submit(data)
+    cache[key] = result
+    return result
+
 def _get_role_category(role: str) -> str:
     """Categorize job role"""
     if "Engineer" in role or "Developer" in role:
@@ -330,8 +484,8 @@ def _get_role_category(role: str) -> str:
     else:
         return "Other"
 
-def _calculate_match_score(employee_data: dict, role: str) -> float:
-    """Calculate job match score based on employee data"""
+def _calculate_match_scores(employee_data: dict) -> np.ndarray:
+    """Calculate job match scores for every role in JOB_ROLES"""
     score = 0.0
     
     # Experience factor
@@ -344,42 +498,47 @@ def _calculate_match_score(employee_data: dict, role: str) -> float:
         score += 10
     
     # Education factor
-    education_bonus = {0: 5, 1: 15, 2: 25, 3: 30}  # High School to PhD
-    score += education_bonus.get(employee_data.get('education_encoded', 1), 15)
+    score += EDU_BONUS[employee_data.get('education_encoded', 1)]
     
     # Performance factor
     performance = employee_data.get('performance_rating', 5)
     score += (performance / 10) * 25
     
-    # Salary expectations alignment
+    # Salary expectations alignment, one entry per role
     current_salary = employee_data.get('current_salary', 50000)
-    role_salary_range = SALARY_RANGES.get(role, (50, 100))
-    role_avg_salary = (role_salary_range[0] + role_salary_range[1]) / 2 * 1000
-    
-    salary_alignment = 1 - abs(current_salary - role_avg_salary) / role_avg_salary
-    score += max(0, salary_alignment * 20)
+    salary_alignment = 1 - np.abs(current_salary - _SAL_AVG) / _SAL_AVG
+    scores = score + np.maximum(0, salary_alignment * 20)
     
-    return min(100, max(0, score))
+    return np.clip(scores, 0, 100)
 
-def _estimate_salary_for_role(employee_data: dict, role: str) -> float:
-    """Estimate salary for role based on employee data"""
-    base_salary_range = SALARY_RANGES.get(role, (50, 100))
-    base_salary = (base_salary_range[0] + base_salary_range[1]) / 2 * 1000
+def _top_n_indices(scores: np.ndarray, n: int) -> np.ndarray:
+    """Indices of the n highest scores, best first, with ties kept in index order"""
+    if n <= 0 or n >= len(scores):
+        return np.argsort(-scores, kind="stable")[:n]
     
+    # argpartition finds the cut-off score in O(N); ties at the cut are then
+    # filled in index order so the result matches a stable full sort
+    threshold = scores[np.argpartition(-scores, n - 1)[:n]].min()
+    above = np.flatnonzero(scores > threshold)
+    tied = np.flatnonzero(scores == threshold)[:n - len(above)]
+    selected = np.concatenate([above, tied])
+    
+    return selected[np.argsort(-scores[selected], kind="stable")]
+
+def _estimate_salaries(employee_data: dict) -> np.ndarray:
+    """Estimate salary for every role in JOB_ROLES based on employee data"""
     # Adjust for experience
     experience = employee_data.get('experience_in_domain', 0)
     exp_multiplier = 1 + (experience * 0.03)
     
     # Adjust for education
-    edu_multipliers = {0: 0.85, 1: 1.0, 2: 1.15, 3: 1.3}
-    edu_multiplier = edu_multipliers.get(employee_data.get('education_encoded', 1), 1.0)
+    edu_multiplier = EDU_MULTIPLIERS[employee_data.get('education_encoded', 1)]
     
     # Adjust for performance
     performance = employee_data.get('performance_rating', 7)
     perf_multiplier = 0.8 + (performance / 10) * 0.4
     
-    estimated_salary = base_salary * exp_multiplier * edu_multiplier * perf_multiplier
-    return round(estimated_salary, 2)
+    return _SAL_AVG * exp_multiplier * edu_multiplier * perf_multiplier
 
 def _get_required_skills(role: str) -> List[str]:
     """Get required skills for a role"""
@@ -393,12 +552,11 @@ def _get_required_skills(role: str) -> List[str]:
     
     return skill_mapping.get(role, ["Communication", "Problem Solving"])
 
-def _get_missing_skills(employee_data: dict, role: str) -> List[str]:
+def _get_missing_skills(employee_data: dict, required_skills: tuple) -> List[str]:
     """Get skills missing for a role (simplified logic)"""
-    required_skills = _get_required_skills(role)
     # In a real scenario, you'd check against employee's actual skills
     # For now, return a subset as "missing"
-    return required_skills[:2] if len(required_skills) > 2 else []
+    return list(required_skills[:2]) if len(required_skills) > 2 else []
 
 def _get_recommendation_reason(employee_data: dict, role: str, match_score: float) -> str:
     """Generate recommendation reason"""
@@ -412,6 +570,22 @@ def _get_recommendation_reason(employee_data: dict, role: str, match_score: floa
     else:
         return f"Potential growth opportunity. Consider developing skills in this area to improve your match score."
 
+# Category and required skills are fixed per role, so evaluate them once for the catalog
+_ROLE_CATEGORY = {role: _get_role_category(role) for role in JOB_ROLES}
+_ROLE_REQUIRED_SKILLS = {role: tuple(_get_required_skills(role)) for role in JOB_ROLES}
+
+# The job roles catalog is derived from static config, so encode it once as well
+_JOB_ROLES_RESPONSE_JSON = orjson.dumps([
+    {
+        "title": role,
+        "min_salary": SALARY_RANGES.get(role, (50, 100))[0] * 1000,
+        "max_salary": SALARY_RANGES.get(role, (50, 100))[1] * 1000,
+        "category": _ROLE_CATEGORY[role]
+    }
+    for role in JOB_ROLES
+])
+_JOB_ROLES_ETAG = _etag(_JOB_ROLES_RESPONSE_JSON)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
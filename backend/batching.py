@@ -0,0 +1,78 @@
+import asyncio
+from typing import Any, Callable, List
+
+
+class AsyncBatcher:
+    """Coalesce concurrent prediction requests into a single batched model call"""
+
+    def __init__(self, predict_batch: Callable[[List[dict]], List[Any]],
+                 max_batch_size: int = 64, max_latency_ms: float = 10):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000
+        self._queue = None
+        self._worker = None
+        self._inflight = set()
+
+    def start(self):
+        """Start the background worker on the running event loop"""
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Cancel the background worker"""
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    def submit(self, item: dict) -> asyncio.Future:
+        """Queue an item for prediction and return a future for its result"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return future
+
+    async def _collect(self):
+        """Wait for one item, then gather more until the batch is full or the window closes"""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_latency
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            # Dispatch without waiting, so the next batch can fill while this one runs
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch):
+        items = [item for item, _ in batch]
+
+        try:
+            # Model inference is blocking NumPy/sklearn work, so keep it off the event loop
+            results = await asyncio.to_thread(self.predict_batch, items)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Scatter results back to waiting requests by position
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,40 @@
+import functools
+import threading
+
+from cachetools import TTLCache
+
+_MISSING = object()
+
+
+class ShortTTLCache:
+    """Thread-safe TTL cache for sync handlers, keyed on their call arguments"""
+
+    def __init__(self, ttl: float, maxsize: int = 1024, ignore: tuple = ("db",)):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._ignore = ignore
+
+    def cached(self, func):
+        """Decorate a handler so repeat calls within the TTL skip its body"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__,) + args + tuple(
+                sorted((name, value) for name, value in kwargs.items() if name not in self._ignore)
+            )
+
+            with self._lock:
+                result = self._cache.get(key, _MISSING)
+            if result is not _MISSING:
+                return result
+
+            result = func(*args, **kwargs)
+            with self._lock:
+                self._cache[key] = result
+            return result
+
+        return wrapper
+
+    def clear(self):
+        """Drop every cached result, e.g. after a write"""
+        with self._lock:
+            self._cache.clear()
@@ -4,6 +4,24 @@ from pathlib import Path
 # Database Configuration
 DATABASE_URL = "sqlite:///./workforce_ai.db"
 DATABASE_PATH = Path("workforce_ai.db")
+DB_POOL_SIZE = 20
+DB_MAX_OVERFLOW = 10
+DB_POOL_TIMEOUT = 30  # Seconds to wait for a free connection
+DB_POOL_RECYCLE = 3600  # Seconds before a pooled connection is replaced
+SEED_CHUNK_SIZE = 10000  # Rows per transaction when seeding from CSV
+
+# Prediction micro-batching
+BATCH_MAX_SIZE = 64  # Max requests coalesced into one model call
+BATCH_MAX_LATENCY_MS = 10  # Max time a request waits for a batch to fill
+
+# Prediction result cache
+PREDICTION_CACHE_SIZE = 4096  # Entries kept per prediction endpoint
+PREDICTION_CACHE_TTL = 600  # Seconds before a cached prediction expires
+DASHBOARD_CACHE_TTL = 30  # Seconds the analytics dashboard may be stale
+# Seconds employee reads are served from cache. Writes through the API clear it;
+# rows changed by other processes can be up to this stale.
+EMPLOYEE_CACHE_TTL = 5
+STATIC_CACHE_MAX_AGE = 300  # Seconds clients may reuse static catalog responses
 
 # Model Paths
 MODEL_DIR = Path("models")
@@ -12,8 +30,7 @@ MODEL_PATHS = {
     "salary": MODEL_DIR / "salary_model.pkl", 
     "role": MODEL_DIR / "role_model.pkl",
     "skill_rating": MODEL_DIR / "skill_rating_model.pkl",
-    "encoders": MODEL_DIR / "encoders.pkl",
-    "scalers": MODEL_DIR / "scalers.pkl"
+    "encoders": MODEL_DIR / "encoders.pkl"
 }
 
 # Data Paths
@@ -8,126 +8,108 @@ import os
 def generate_employee_data(n_employees=1000):
     """Generate synthetic employee data for training"""
     
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     random.seed(42)
     
-    employees = []
-    
     # Flatten skills from all categories
     all_skills = []
     for category, skills in SKILL_CATEGORIES.items():
         all_skills.extend(skills)
     
-    for i in range(n_employees):
-        # Basic demographics
-        age = np.random.normal(32, 8)
-        age = max(22, min(60, int(age)))
-        
-        joining_year = np.random.randint(2015, 2024)
-        experience = max(0, age - 22 - (2023 - joining_year))
-        experience = min(experience, 25)
-        
-        # Role and department
-        role = random.choice(JOB_ROLES)
-        department = random.choice(["Engineering", "Data Science", "Product", "Design", "Operations"])
-        
-        # Education
-        education_level = random.choices(
-            ["High School", "Bachelors", "Masters", "PhD"],
-            weights=[10, 50, 30, 10]
-        )[0]
-        
-        # Salary based on role, experience, and education
-        base_salary_min, base_salary_max = SALARY_RANGES[role]
-        
-        # Adjust for experience
-        exp_multiplier = 1 + (experience * 0.05)
-        
-        # Adjust for education
-        edu_multipliers = {"High School": 0.8, "Bachelors": 1.0, "Masters": 1.2, "PhD": 1.4}
-        edu_multiplier = edu_multipliers[education_level]
-        
-        current_salary = np.random.uniform(
-            base_salary_min * exp_multiplier * edu_multiplier,
-            base_salary_max * exp_multiplier * edu_multiplier
-        ) * 1000
-        
-        # Expected salary (usually 5-15% increase)
-        salary_growth_rate = np.random.uniform(0.05, 0.15)
-        expected_salary = current_salary * (1 + salary_growth_rate)
-        
-        # Payment tier based on salary
-        if current_salary < 60000:
-            payment_tier = 1
-        elif current_salary < 100000:
-            payment_tier = 2
-        else:
-            payment_tier = 3
-        
-        # Performance rating (affects retention)
-        performance_rating = np.random.normal(7.5, 1.5)
-        performance_rating = max(1, min(10, performance_rating))
-        
-        # Will leave prediction (based on multiple factors)
-        leave_probability = 0.2  # Base probability
-        
+    # Basic demographics
+    age = np.clip(rng.normal(32, 8, n_employees).astype(int), 22, 60)
+    joining_year = rng.integers(2015, 2024, n_employees)
+    experience = np.clip(age - 22 - (2023 - joining_year), 0, 25)
+    
+    # Role and department
+    role_idx = rng.integers(0, len(JOB_ROLES), n_employees)
+    role = np.array(JOB_ROLES)[role_idx]
+    department = rng.choice(["Engineering", "Data Science", "Product", "Design", "Operations"], n_employees)
+    
+    # Education
+    education_levels = np.array(["High School", "Bachelors", "Masters", "PhD"])
+    edu_idx = rng.choice(len(education_levels), n_employees, p=[0.1, 0.5, 0.3, 0.1])
+    education_level = education_levels[edu_idx]
+    
+    # Salary based on role, experience, and education
+    salary_ranges = np.array([SALARY_RANGES[r] for r in JOB_ROLES])
+    base_salary_min = salary_ranges[role_idx, 0]
+    base_salary_max = salary_ranges[role_idx, 1]
+    
+    # Adjust for experience and education
+    exp_multiplier = 1 + (experience * 0.05)
+    edu_multiplier = np.array([0.8, 1.0, 1.2, 1.4])[edu_idx]
+    
+    current_salary = rng.uniform(
+        base_salary_min * exp_multiplier * edu_multiplier,
+        base_salary_max * exp_multiplier * edu_multiplier
+    ) * 1000
+    
+    # Expected salary (usually 5-15% increase)
+    salary_growth_rate = rng.uniform(0.05, 0.15, n_employees)
+    expected_salary = current_salary * (1 + salary_growth_rate)
+    
+    # Payment tier based on salary: <60k -> 1, <100k -> 2, else 3
+    payment_tier = np.digitize(current_salary, [60000, 100000]) + 1
+    
+    # Performance rating (affects retention)
+    performance_rating = np.clip(rng.normal(7.5, 1.5, n_employees), 1, 10)
+    
+    # Will leave prediction (based on multiple factors)
+    leave_probability = (
+        0.2  # Base probability
         # Factors that increase leave probability
-        if performance_rating < 6:
-            leave_probability += 0.3
-        if salary_growth_rate < 0.08:
-            leave_probability += 0.2
-        if experience > 8 and payment_tier == 1:
-            leave_probability += 0.25
-        if age > 45:
-            leave_probability += 0.15
-        
+        + 0.3 * (performance_rating < 6)
+        + 0.2 * (salary_growth_rate < 0.08)
+        + 0.25 * ((experience > 8) & (payment_tier == 1))
+        + 0.15 * (age > 45)
         # Factors that decrease leave probability
-        if performance_rating > 8:
-            leave_probability -= 0.2
-        if salary_growth_rate > 0.12:
-            leave_probability -= 0.15
-        if payment_tier == 3:
-            leave_probability -= 0.1
-        
-        will_leave = random.random() < max(0.05, min(0.8, leave_probability))
-        
-        # Skills (random selection based on role)
-        role_relevant_skills = []
-        if "Engineer" in role or "Developer" in role:
-            role_relevant_skills.extend(SKILL_CATEGORIES["Technical"][:8])
-        if "Data" in role or "ML" in role:
-            role_relevant_skills.extend(SKILL_CATEGORIES["Analytical"])
-        if "Manager" in role or "Lead" in role:
-            role_relevant_skills.extend(SKILL_CATEGORIES["Management"])
-        if "Designer" in role:
-            role_relevant_skills.extend(SKILL_CATEGORIES["Design"])
-        
-        # Add some random skills
-        role_relevant_skills.extend(random.sample(all_skills, 3))
-        role_relevant_skills = list(set(role_relevant_skills))
-        
-        employee = {
-            "id": i + 1,
-            "name": f"Employee_{i+1}",
-            "email": f"employee{i+1}@company.com",
-            "age": age,
-            "joining_year": joining_year,
-            "payment_tier": payment_tier,
-            "experience_in_domain": experience,
-            "current_salary": round(current_salary, 2),
-            "expected_salary": round(expected_salary, 2),
-            "education_level": education_level,
-            "current_role": role,
-            "department": department,
-            "location": random.choice(["New York", "San Francisco", "Austin", "Seattle", "Remote"]),
-            "performance_rating": round(performance_rating, 2),
-            "will_leave": will_leave,
-            "skills": ",".join(random.sample(role_relevant_skills, min(len(role_relevant_skills), 8)))
-        }
-        
-        employees.append(employee)
-    
-    return pd.DataFrame(employees)
+        - 0.2 * (performance_rating > 8)
+        - 0.15 * (salary_growth_rate > 0.12)
+        - 0.1 * (payment_tier == 3)
+    )
+    will_leave = rng.random(n_employees) < np.clip(leave_probability, 0.05, 0.8)
+    
+    # Skills (random selection based on role)
+    role_skill_pools = {}
+    for job_role in JOB_ROLES:
+        pool = []
+        if "Engineer" in job_role or "Developer" in job_role:
+            pool.extend(SKILL_CATEGORIES["Technical"][:8])
+        if "Data" in job_role or "ML" in job_role:
+            pool.extend(SKILL_CATEGORIES["Analytical"])
+        if "Manager" in job_role or "Lead" in job_role:
+            pool.extend(SKILL_CATEGORIES["Management"])
+        if "Designer" in job_role:
+            pool.extend(SKILL_CATEGORIES["Design"])
+        role_skill_pools[job_role] = pool
+    
+    def _sample_skills(job_role):
+        # Role skills plus some random skills, de-duplicated in a stable order
+        pool = list(dict.fromkeys(role_skill_pools[job_role] + random.sample(all_skills, 3)))
+        return ",".join(random.sample(pool, min(len(pool), 8)))
+    
+    ids = np.arange(1, n_employees + 1)
+    id_strings = ids.astype(str)
+    
+    return pd.DataFrame({
+        "id": ids,
+        "name": np.char.add("Employee_", id_strings),
+        "email": np.char.add(np.char.add("employee", id_strings), "@company.com"),
+        "age": age,
+        "joining_year": joining_year,
+        "payment_tier": payment_tier,
+        "experience_in_domain": experience,
+        "current_salary": np.round(current_salary, 2),
+        "expected_salary": np.round(expected_salary, 2),
+        "education_level": education_level,
+        "current_role": role,
+        "department": department,
+        "location": rng.choice(["New York", "San Francisco", "Austin", "Seattle", "Remote"], n_employees),
+        "performance_rating": np.round(performance_rating, 2),
+        "will_leave": will_leave,
+        "skills": [_sample_skills(job_role) for job_role in role]
+    })
 
 def generate_skills_data():
     """Generate skills master data"""
@@ -194,7 +176,8 @@ def generate_job_roles_data():
     
     return pd.DataFrame(roles_data)
 
-if __name__ == "__main__":
+def main():
+    """Generate and save all synthetic datasets"""
     # Create data directory
     os.makedirs("data", exist_ok=True)
     
@@ -218,7 +201,7 @@ if __name__ == "__main__":
     # Add derived features
     training_data["annual_growth"] = training_data["expected_salary"] - training_data["current_salary"]
     training_data["salary_growth_rate"] = training_data["annual_growth"] / training_data["current_salary"]
-    training_data["tenure"] = 2023 - training_data["joining_year"]
+    training_data["tenure"] = datetime.now().year - training_data["joining_year"]
     
     # Education encoding
     education_map = {"High School": 0, "Bachelors": 1, "Masters": 2, "PhD": 3}
@@ -229,4 +212,7 @@ if __name__ == "__main__":
     print("Data generation completed!")
     print(f"Generated {len(employees_df)} employee records")
     print(f"Generated {len(skills_df)} skills")
-    print(f"Generated {len(roles_df)} job roles")
\ No newline at end of file
+    print(f"Generated {len(roles_df)} job roles")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,19 +1,68 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from config import DATABASE_URL
-from database.models import Base
+from config import (
+    DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE,
+    DATA_PATHS, SEED_CHUNK_SIZE
+)
+from database.models import Base, Employee, EmployeeSkill
+import pandas as pd
 import os
 
 # Create database engine
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE
+)
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Enable WAL so readers don't block on writers, and enlarge the page cache"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def _migrate_employee_skills_pk():
+    """Rebuild an employee_skills table created with the old surrogate id key"""
+    inspector = inspect(engine)
+    if "id" not in {column["name"] for column in inspector.get_columns("employee_skills")}:
+        return
+    
+    columns = ", ".join(column.name for column in EmployeeSkill.__table__.columns)
+    with engine.begin() as conn:
+        # SQLite can't alter a primary key; free the index names, then copy into a new table
+        for index_name in [index["name"] for index in inspector.get_indexes("employee_skills")]:
+            conn.exec_driver_sql(f'DROP INDEX IF EXISTS "{index_name}"')
+        conn.exec_driver_sql("ALTER TABLE employee_skills RENAME TO employee_skills_old")
+        EmployeeSkill.__table__.create(bind=conn)
+        # Duplicate (employee, skill) rows collapse to the first one
+        conn.exec_driver_sql(
+            f"INSERT OR IGNORE INTO employee_skills ({columns}) "
+            f"SELECT {columns} FROM employee_skills_old "
+            f"WHERE employee_id IS NOT NULL AND skill_id IS NOT NULL ORDER BY id"
+        )
+        conn.exec_driver_sql("DROP TABLE employee_skills_old")
+
 def create_tables():
     """Create all database tables"""
     Base.metadata.create_all(bind=engine)
+    _migrate_employee_skills_pk()
+    
+    # create_all skips tables that already exist, so add any newly declared indexes
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
 def get_db():
     """Get database session"""
@@ -23,6 +72,29 @@ def get_db():
     finally:
         db.close()
 
+def seed_employees(csv_path=DATA_PATHS["employees"], chunk_size=SEED_CHUNK_SIZE):
+    """Load generated employees into an empty employees table"""
+    if not os.path.exists(csv_path):
+        return 0
+    
+    db = SessionLocal()
+    try:
+        if db.query(Employee.id).first() is not None:
+            return 0
+        
+        # Only read columns the table has; skills live in employee_skills, not here
+        columns = Employee.__table__.columns.keys()
+        inserted = 0
+        for chunk in pd.read_csv(csv_path, usecols=lambda c: c in columns, chunksize=chunk_size):
+            rows = chunk.astype(object).where(chunk.notna(), None).to_dict("records")
+            # Bulk path skips per-object unit-of-work bookkeeping; one commit per chunk
+            db.bulk_insert_mappings(Employee, rows)
+            db.commit()
+            inserted += len(rows)
+        return inserted
+    finally:
+        db.close()
+
 def init_database():
     """Initialize database with sample data"""
     create_tables()
@@ -31,4 +103,8 @@ def init_database():
     os.makedirs("models", exist_ok=True)
     os.makedirs("data", exist_ok=True)
     
+    seeded = seed_employees()
+    if seeded:
+        print(f"Seeded {seeded} employees from {DATA_PATHS['employees']}")
+    
     print("Database initialized successfully!")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text, JSON, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -18,17 +18,17 @@ class Employee(Base):
     current_salary = Column(Float)
     expected_salary = Column(Float)
     education_level = Column(String(50))
-    current_role = Column(String(100))
-    department = Column(String(100))
-    location = Column(String(100))
+    current_role = Column(String(100), index=True)
+    department = Column(String(100), index=True)
+    location = Column(String(100), index=True)
     performance_rating = Column(Float)
     will_leave = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    skills = relationship("EmployeeSkill", back_populates="employee")
-    assessments = relationship("SkillAssessment", back_populates="employee")
+    skills = relationship("EmployeeSkill", back_populates="employee", lazy="selectin")
+    assessments = relationship("SkillAssessment", back_populates="employee", foreign_keys="SkillAssessment.employee_id", lazy="selectin")
 
 class JobRole(Base):
     __tablename__ = "job_roles"
@@ -56,15 +56,15 @@ class Skill(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
-    employee_skills = relationship("EmployeeSkill", back_populates="skill")
-    assessments = relationship("SkillAssessment", back_populates="skill")
+    employee_skills = relationship("EmployeeSkill", back_populates="skill", lazy="selectin")
+    assessments = relationship("SkillAssessment", back_populates="skill", lazy="selectin")
 
 class EmployeeSkill(Base):
     __tablename__ = "employee_skills"
     
-    id = Column(Integer, primary_key=True, index=True)
-    employee_id = Column(Integer, ForeignKey("employees.id"))
-    skill_id = Column(Integer, ForeignKey("skills.id"))
+    # One row per employee per skill; the key also serves employee_id lookups as its prefix
+    employee_id = Column(Integer, ForeignKey("employees.id"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), primary_key=True, index=True)
     proficiency_level = Column(Float)  # 1-10 scale
     years_experience = Column(Float)
     self_rating = Column(Float)  # 1-10 scale
@@ -79,11 +79,11 @@ class SkillAssessment(Base):
     __tablename__ = "skill_assessments"
     
     id = Column(Integer, primary_key=True, index=True)
-    employee_id = Column(Integer, ForeignKey("employees.id"))
-    skill_id = Column(Integer, ForeignKey("skills.id"))
+    employee_id = Column(Integer, ForeignKey("employees.id"), index=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), index=True)
     assessment_type = Column(String(50))  # "technical_test", "peer_review", "manager_review"
     score = Column(Float)  # 1-10 scale
-    assessor_id = Column(Integer, ForeignKey("employees.id"), nullable=True)
+    assessor_id = Column(Integer, ForeignKey("employees.id"), nullable=True, index=True)
     notes = Column(Text)
     assessment_date = Column(DateTime, default=datetime.utcnow)
     
@@ -93,10 +93,14 @@ class SkillAssessment(Base):
 
 class JobRecommendation(Base):
     __tablename__ = "job_recommendations"
+    # Active recommendations for an employee; also serves employee_id lookups
+    __table_args__ = (
+        Index("ix_jobrec_emp_active", "employee_id", "is_active"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(Integer, ForeignKey("employees.id"))
-    job_role_id = Column(Integer, ForeignKey("job_roles.id"))
+    job_role_id = Column(Integer, ForeignKey("job_roles.id"), index=True)
     match_score = Column(Float)  # 0-100 percentage
     skill_gap_analysis = Column(JSON)  # Missing skills and their importance
     salary_estimate = Column(Float)
@@ -2,18 +2,28 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import joblib
-import matplotlib.pyplot as plt
 
 st.set_page_config(page_title="Workforce Distribution AI", layout="wide")
 
-# Load Models and Tools
-leave_model = joblib.load("model.pkl")
-salary_model = joblib.load("salary_predictor.pkl")
-role_model = joblib.load("role_classifier.pkl")
-role_encoder = joblib.load("role_encoder.pkl")
-imputer = joblib.load("imputer.pkl")
-df = pd.read_csv("Employee.csv")
+# Load Models and Tools (once per process, not on every rerun)
+@st.cache_resource
+def load_artifacts():
+    return {
+        "leave": joblib.load("model.pkl"),
+        "salary": joblib.load("salary_predictor.pkl"),
+        "role": joblib.load("role_classifier.pkl"),
+        "role_encoder": joblib.load("role_encoder.pkl"),
+        "imputer": joblib.load("imputer.pkl")
+    }
+
+artifacts = load_artifacts()
+leave_model = artifacts["leave"]
+salary_model = artifacts["salary"]
+role_model = artifacts["role"]
+role_encoder = artifacts["role_encoder"]
+imputer = artifacts["imputer"]
 
 st.title("📊 Workforce Distribution AI")
 st.subheader("🔍 Predict Retention, Salary Growth & Role Classification")
@@ -66,12 +76,32 @@ if st.button("Predict Retention & Role"):
 
 # Salary Growth Visualization
 st.subheader("📈 Average Wage Growth by Experience")
-df["AnnualWageGrowth"] = df["ExpectedNextYearSalary"] - df["CurrentSalary"]
-avg_growth = df.groupby("ExperienceInCurrentDomain")["AnnualWageGrowth"].mean()
-
-fig, ax = plt.subplots()
-avg_growth.plot(kind='line', marker='o', ax=ax, color='green')
-ax.set_title("Avg Annual Wage Growth vs. Experience")
-ax.set_xlabel("Experience (Years)")
-ax.set_ylabel("Annual Wage Growth")
-st.pyplot(fig)
+
+@st.cache_data
+def avg_growth_by_experience():
+    # Only the chart needs the employee file, and only these three columns of it
+    df = pd.read_csv(
+        "Employee.csv",
+        engine="pyarrow",
+        usecols=["ExperienceInCurrentDomain", "ExpectedNextYearSalary", "CurrentSalary"],
+        dtype={"ExperienceInCurrentDomain": "int16", "ExpectedNextYearSalary": "float32", "CurrentSalary": "float32"}
+    )
+    experience = df["ExperienceInCurrentDomain"].to_numpy(dtype=np.int64)
+    growth = (df["ExpectedNextYearSalary"] - df["CurrentSalary"]).to_numpy(dtype=np.float64)
+    
+    # Experience is a small non-negative int, so a per-year mean is two bincounts;
+    # rows without a growth value are skipped, as groupby().mean() does
+    valid = ~np.isnan(growth)
+    sums = np.bincount(experience[valid], weights=growth[valid])
+    counts = np.bincount(experience[valid])
+    present = counts > 0
+    
+    return pd.Series(
+        sums[present] / counts[present],
+        index=pd.Index(np.nonzero(present)[0], name="Experience (Years)"),
+        name="Annual Wage Growth"
+    )
+
+# Rendered client-side, so reruns don't build a matplotlib figure
+avg_growth = avg_growth_by_experience()
+st.line_chart(avg_growth, color="#008000")
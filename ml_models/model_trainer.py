@@ -1,34 +1,87 @@
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor, GradientBoostingRegressor
-from sklearn.linear_model import LogisticRegression
-from sklearn.preprocessing import LabelEncoder, StandardScaler
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor, HistGradientBoostingRegressor
+from sklearn.preprocessing import LabelEncoder
 from sklearn.impute import SimpleImputer
-from sklearn.metrics import accuracy_score, mean_squared_error, classification_report
+from sklearn.metrics import accuracy_score, mean_squared_error
 import joblib
 import os
+import time
+from datetime import date
+from concurrent.futures import ThreadPoolExecutor
 from config import MODEL_PATHS
 
+try:
+    import numba
+except ImportError:  # Optional; the NumPy label path is used without it
+    numba = None
+
+# Below this many rows, numba's thread startup and first-call compile cost more than it saves
+NUMBA_MIN_ROWS = 1_000_000
+
+TRAINING_DTYPES = {
+    'age': 'int16',
+    'joining_year': 'int16',
+    'payment_tier': 'int8',
+    'experience_in_domain': 'int16',
+    'education_encoded': 'int8',
+    'current_role': 'category'
+}
+
+def _skill_ratings_numpy(performance, experience, education, noise):
+    """Synthetic skill rating from performance, experience and education, column-wise"""
+    base_rating = np.clip(performance + noise, 1, 10)
+    
+    # Experience bonus
+    exp_bonus = np.minimum(2, experience * 0.2)
+    
+    # Education bonus
+    edu_bonus = education * 0.3
+    
+    return np.clip(base_rating + exp_bonus + edu_bonus, 1, 10)
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _skill_ratings_kernel(performance, experience, education, noise, out):
+        """Same formula as _skill_ratings_numpy, fused into one parallel loop"""
+        for i in numba.prange(performance.shape[0]):
+            base_rating = min(10.0, max(1.0, performance[i] + noise[i]))
+            exp_bonus = min(2.0, experience[i] * 0.2)
+            out[i] = min(10.0, max(1.0, base_rating + exp_bonus + education[i] * 0.3))
+
+def _skill_ratings(performance, experience, education, noise):
+    """Compute synthetic skill ratings, with the numba kernel for large inputs when available"""
+    if numba is None or len(performance) < NUMBA_MIN_ROWS:
+        return _skill_ratings_numpy(performance, experience, education, noise)
+    
+    out = np.empty(len(performance), dtype=np.float64)
+    _skill_ratings_kernel(performance, experience, education, noise, out)
+    return out
+
 class WorkforceMLTrainer:
     def __init__(self):
         self.models = {}
         self.encoders = {}
-        self.scalers = {}
         self.imputer = SimpleImputer(strategy='median')
+        self._X_cached = None
         
     def load_data(self):
         """Load training data"""
         print("Loading training data...")
-        self.df = pd.read_csv("data/training_data.csv")
+        # pyarrow parses in parallel; narrow dtypes cut memory for every later column op
+        self.df = pd.read_csv("data/training_data.csv", engine='pyarrow', dtype=TRAINING_DTYPES)
         self.skills_df = pd.read_csv("data/skills.csv")
         self.roles_df = pd.read_csv("data/job_roles.csv")
+        self._X_cached = None
         
         print(f"Loaded {len(self.df)} employee records")
         return self.df
     
     def prepare_features(self, df):
-        """Prepare features for ML models"""
+        """Prepare features for ML models, fitting the imputer only on the first call"""
+        if self._X_cached is not None:
+            return self._X_cached
         
         # Select numerical features
         feature_cols = [
@@ -39,10 +92,13 @@ class WorkforceMLTrainer:
         
         X = df[feature_cols].copy()
         
-        # Handle missing values
-        X = pd.DataFrame(self.imputer.fit_transform(X), columns=feature_cols)
+        # Handle missing values; every model shares this one fit, as does inference.
+        # Fit on a plain array: inference passes arrays, so no feature names are recorded
+        X = X.to_numpy(dtype=float)
+        self.imputer.fit(X)
+        self._X_cached = pd.DataFrame(self.imputer.transform(X), columns=feature_cols)
         
-        return X
+        return self._X_cached
     
     def train_retention_model(self):
         """Train employee retention prediction model"""
@@ -51,10 +107,11 @@ class WorkforceMLTrainer:
         X = self.prepare_features(self.df)
         y = self.df['will_leave'].astype(int)
         
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        X_train, X_test, y_train, y_test = train_test_split(X.to_numpy(), y, test_size=0.2, random_state=42)
         
         # Train Random Forest model
-        model = RandomForestClassifier(n_estimators=100, random_state=42, max_depth=10)
+        model = RandomForestClassifier(n_estimators=100, random_state=42, max_depth=10,
+                                       max_features='sqrt', n_jobs=-1)
         model.fit(X_train, y_train)
         
         # Evaluate
@@ -72,10 +129,10 @@ class WorkforceMLTrainer:
         X = self.prepare_features(self.df)
         y = self.df['expected_salary']
         
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        X_train, X_test, y_train, y_test = train_test_split(X.to_numpy(), y, test_size=0.2, random_state=42)
         
-        # Train Gradient Boosting model
-        model = GradientBoostingRegressor(n_estimators=100, random_state=42, max_depth=6)
+        # Train histogram-based Gradient Boosting model (bins features, much faster than exact splits)
+        model = HistGradientBoostingRegressor(max_iter=200, max_depth=6, learning_rate=0.1, random_state=42)
         model.fit(X_train, y_train)
         
         # Evaluate
@@ -96,10 +153,11 @@ class WorkforceMLTrainer:
         role_encoder = LabelEncoder()
         y = role_encoder.fit_transform(self.df['current_role'])
         
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        X_train, X_test, y_train, y_test = train_test_split(X.to_numpy(), y, test_size=0.2, random_state=42)
         
         # Train Random Forest model
-        model = RandomForestClassifier(n_estimators=100, random_state=42, max_depth=15)
+        model = RandomForestClassifier(n_estimators=100, random_state=42, max_depth=15,
+                                       max_features='sqrt', n_jobs=-1)
         model.fit(X_train, y_train)
         
         # Evaluate
@@ -115,44 +173,27 @@ class WorkforceMLTrainer:
         """Train skill rating prediction model"""
         print("Training skill rating model...")
         
-        # Generate synthetic skill ratings based on employee data
-        skill_ratings = []
-        
-        for idx, employee in self.df.iterrows():
-            # Simulate skill ratings based on role, experience, and performance
-            base_rating = min(10, max(1, employee['performance_rating'] + np.random.normal(0, 1)))
-            
-            # Experience bonus
-            exp_bonus = min(2, employee['experience_in_domain'] * 0.2)
-            
-            # Education bonus
-            edu_bonus = employee['education_encoded'] * 0.3
-            
-            final_rating = min(10, max(1, base_rating + exp_bonus + edu_bonus))
-            
-            skill_ratings.append({
-                'employee_id': idx,
-                'age': employee['age'],
-                'experience_in_domain': employee['experience_in_domain'],
-                'education_encoded': employee['education_encoded'],
-                'performance_rating': employee['performance_rating'],
-                'current_salary': employee['current_salary'],
-                'payment_tier': employee['payment_tier'],
-                'skill_rating': final_rating
-            })
-        
-        skill_df = pd.DataFrame(skill_ratings)
-        
         feature_cols = ['age', 'experience_in_domain', 'education_encoded', 
                        'performance_rating', 'current_salary', 'payment_tier']
         
+        # Generate synthetic skill ratings based on role, experience, and performance
+        noise = np.random.normal(0, 1, size=len(self.df))
+        skill_df = self.df[feature_cols].copy()
+        skill_df['skill_rating'] = _skill_ratings(
+            self.df['performance_rating'].to_numpy(),
+            self.df['experience_in_domain'].to_numpy(),
+            self.df['education_encoded'].to_numpy(),
+            noise
+        )
+        
         X = skill_df[feature_cols]
         y = skill_df['skill_rating']
         
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        X_train, X_test, y_train, y_test = train_test_split(X.to_numpy(), y, test_size=0.2, random_state=42)
         
         # Train Random Forest Regressor
-        model = RandomForestRegressor(n_estimators=100, random_state=42, max_depth=10)
+        model = RandomForestRegressor(n_estimators=100, random_state=42, max_depth=10,
+                                      max_features='sqrt', n_jobs=-1)
         model.fit(X_train, y_train)
         
         # Evaluate
@@ -170,13 +211,13 @@ class WorkforceMLTrainer:
         # Create models directory
         os.makedirs("models", exist_ok=True)
         
-        # Save individual models
+        # Save individual models; forests compress well, so cold starts read far less from disk
         for model_name, model in self.models.items():
             model_path = MODEL_PATHS[model_name]
-            joblib.dump(model, model_path)
+            joblib.dump(model, model_path, compress=3)
             print(f"Saved {model_name} model to {model_path}")
         
-        # Save encoders and scalers
+        # Save encoders and imputer
         joblib.dump(self.encoders, MODEL_PATHS['encoders'])
         joblib.dump(self.imputer, "models/imputer.pkl")
         
@@ -189,11 +230,21 @@ class WorkforceMLTrainer:
         # Load data
         self.load_data()
         
-        # Train models
-        self.train_retention_model()
-        self.train_salary_model()
-        self.train_role_classification_model()
-        self.train_skill_rating_model()
+        # Impute once up front so the concurrent trainers share one fit
+        self.prepare_features(self.df)
+        
+        # Train models concurrently; sklearn releases the GIL during fit and each
+        # trainer writes its own key in self.models
+        trainers = [
+            self.train_retention_model,
+            self.train_salary_model,
+            self.train_role_classification_model,
+            self.train_skill_rating_model
+        ]
+        with ThreadPoolExecutor(max_workers=len(trainers)) as executor:
+            futures = [executor.submit(trainer) for trainer in trainers]
+            for future in futures:
+                future.result()
         
         # Save models
         self.save_models()
@@ -204,18 +255,38 @@ class ModelPredictor:
     def __init__(self):
         self.models = {}
         self.encoders = {}
+        self.role_classes = []
         self.imputer = None
+        self.feature_cols = [
+            'age', 'joining_year', 'payment_tier', 'experience_in_domain',
+            'current_salary', 'expected_salary', 'education_encoded',
+            'performance_rating', 'annual_growth', 'salary_growth_rate', 'tenure'
+        ]
+        self.feature_idx = {col: i for i, col in enumerate(self.feature_cols)}
+        self.skill_feature_cols = [
+            'age', 'experience_in_domain', 'education_encoded',
+            'performance_rating', 'current_salary', 'payment_tier'
+        ]
+        self.skill_feature_idx = [self.feature_idx[col] for col in self.skill_feature_cols]
+        # Read the clock once, not per prediction
+        self._current_year = date.today().year
         self.load_models()
     
     def load_models(self):
         """Load trained models"""
         try:
-            self.models['retention'] = joblib.load(MODEL_PATHS['retention'])
-            self.models['salary'] = joblib.load(MODEL_PATHS['salary'])
-            self.models['role'] = joblib.load(MODEL_PATHS['role'])
-            self.models['skill_rating'] = joblib.load(MODEL_PATHS['skill_rating'])
+            for model_name in ('retention', 'salary', 'role', 'skill_rating'):
+                start = time.perf_counter()
+                model = joblib.load(MODEL_PATHS[model_name])
+                # Forests train in parallel, but small prediction batches lose more to thread dispatch than they gain
+                if hasattr(model, 'n_jobs'):
+                    model.n_jobs = 1
+                self.models[model_name] = model
+                print(f"Loaded {model_name} model in {time.perf_counter() - start:.3f}s")
             
             self.encoders = joblib.load(MODEL_PATHS['encoders'])
+            # Plain list for decoding role predictions without LabelEncoder overhead
+            self.role_classes = list(self.encoders['role'].classes_)
             self.imputer = joblib.load("models/imputer.pkl")
             
             print("Models loaded successfully!")
@@ -223,69 +294,141 @@ class ModelPredictor:
             print(f"Model files not found: {e}")
             print("Please run training first!")
     
-    def predict_retention(self, employee_data):
-        """Predict if employee will leave"""
-        X = self._prepare_input(employee_data)
-        prediction = self.models['retention'].predict(X)[0]
-        probability = self.models['retention'].predict_proba(X)[0]
-        
-        return {
-            'will_leave': bool(prediction),
-            'leave_probability': probability[1],
-            'stay_probability': probability[0]
+    def warmup(self):
+        """Run one dummy prediction per model so the first real request skips lazy initialization"""
+        sample = {
+            'age': 30, 'joining_year': 2020, 'payment_tier': 2, 'experience_in_domain': 3,
+            'current_salary': 70000.0, 'expected_salary': 75000.0, 'education_encoded': 1,
+            'performance_rating': 7.5
         }
+        
+        start = time.perf_counter()
+        self.predict_retention(sample)
+        self.predict_salary(sample)
+        self.predict_role(sample)
+        self.predict_skill_rating(sample)
+        print(f"Models warmed up in {time.perf_counter() - start:.3f}s")
+    
+    def predict_retention(self, employee_data):
+        """Predict if employee will leave, for one record or a list of records"""
+        records, single = self._as_records(employee_data)
+        results = self._retention_results(self._prepare_input(records))
+        return results[0] if single else results
     
     def predict_salary(self, employee_data):
-        """Predict next year salary"""
-        X = self._prepare_input(employee_data)
-        prediction = self.models['salary'].predict(X)[0]
-        return round(prediction, 2)
+        """Predict next year salary, for one record or a list of records"""
+        records, single = self._as_records(employee_data)
+        results = self._salary_results(self._prepare_input(records))
+        return results[0] if single else results
     
     def predict_role(self, employee_data):
-        """Predict best job role"""
-        X = self._prepare_input(employee_data)
-        prediction = self.models['role'].predict(X)[0]
-        role_name = self.encoders['role'].inverse_transform([prediction])[0]
-        probability = self.models['role'].predict_proba(X)[0].max()
-        
-        return {
-            'role': role_name,
-            'confidence': probability
-        }
+        """Predict best job role, for one record or a list of records"""
+        records, single = self._as_records(employee_data)
+        results = self._role_results(self._prepare_input(records))
+        return results[0] if single else results
     
     def predict_skill_rating(self, employee_data):
-        """Predict skill rating"""
-        feature_cols = ['age', 'experience_in_domain', 'education_encoded', 
-                       'performance_rating', 'current_salary', 'payment_tier']
-        
-        X = pd.DataFrame([employee_data])[feature_cols]
-        prediction = self.models['skill_rating'].predict(X)[0]
-        
-        return min(10, max(1, round(prediction, 1)))
+        """Predict skill rating, for one record or a list of records"""
+        records, single = self._as_records(employee_data)
+        X = pd.DataFrame(records)[self.skill_feature_cols].to_numpy(dtype=float)
+        results = self._skill_rating_results(X)
+        return results[0] if single else results
     
-    def _prepare_input(self, employee_data):
-        """Prepare input data for prediction"""
-        feature_cols = [
-            'age', 'joining_year', 'payment_tier', 'experience_in_domain',
-            'current_salary', 'expected_salary', 'education_encoded',
-            'performance_rating', 'annual_growth', 'salary_growth_rate', 'tenure'
+    def predict_all(self, employee_data):
+        """Run all four predictions, for one record or a list of records, building the features once"""
+        records, single = self._as_records(employee_data)
+        raw = self._feature_matrix(records)
+        X = self.imputer.transform(raw)
+        
+        results = [
+            {
+                'retention': retention,
+                'salary': salary,
+                'role': role,
+                'skill_rating': skill_rating
+            }
+            for retention, salary, role, skill_rating in zip(
+                self._retention_results(X),
+                self._salary_results(X),
+                self._role_results(X),
+                # The skill model was trained on raw, unimputed columns
+                self._skill_rating_results(raw[:, self.skill_feature_idx])
+            )
         ]
-        
-        df = pd.DataFrame([employee_data])
-        
-        # Calculate derived features
-        if 'annual_growth' not in df.columns:
-            df['annual_growth'] = df['expected_salary'] - df['current_salary']
-        if 'salary_growth_rate' not in df.columns:
-            df['salary_growth_rate'] = df['annual_growth'] / df['current_salary']
-        if 'tenure' not in df.columns:
-            df['tenure'] = 2023 - df['joining_year']
-        
-        X = df[feature_cols]
-        X = pd.DataFrame(self.imputer.transform(X), columns=feature_cols)
+        return results[0] if single else results
+    
+    def _retention_results(self, X):
+        model = self.models['retention']
+        probabilities = model.predict_proba(X)
+        predictions = model.classes_.take(probabilities.argmax(axis=1))
+        
+        return [
+            {
+                'will_leave': bool(prediction),
+                'leave_probability': probability[1],
+                'stay_probability': probability[0]
+            }
+            for prediction, probability in zip(predictions, probabilities)
+        ]
+    
+    def _salary_results(self, X):
+        predictions = self.models['salary'].predict(X)
+        return [round(prediction, 2) for prediction in predictions]
+    
+    def _role_results(self, X):
+        model = self.models['role']
+        probabilities = model.predict_proba(X)
+        predictions = model.classes_.take(probabilities.argmax(axis=1))
+        role_names = [self.role_classes[int(prediction)] for prediction in predictions]
+        
+        return [
+            {
+                'role': role_name,
+                'confidence': confidence
+            }
+            for role_name, confidence in zip(role_names, probabilities.max(axis=1))
+        ]
+    
+    def _skill_rating_results(self, X):
+        predictions = self.models['skill_rating'].predict(X)
+        return [min(10, max(1, round(prediction, 1))) for prediction in predictions]
+    
+    @staticmethod
+    def _as_records(employee_data):
+        """Normalize a single record or an iterable of records to (list, was_single)"""
+        if isinstance(employee_data, dict):
+            return [employee_data], True
+        return list(employee_data), False
+    
+    def _prepare_input(self, records):
+        """Prepare a batch of input records as one imputed feature matrix"""
+        return self.imputer.transform(self._feature_matrix(records))
+    
+    def _feature_matrix(self, records):
+        """Build the raw feature matrix for a batch of records, before imputation"""
+        idx = self.feature_idx
+        
+        # Fill a preallocated matrix directly; building a DataFrame dominated small batches
+        X = np.empty((len(records), len(self.feature_cols)), dtype=np.float64)
+        for row, record in zip(X, records):
+            for i, col in enumerate(self.feature_cols):
+                value = record.get(col)
+                row[i] = np.nan if value is None else value
+            
+            # Calculate derived features the caller didn't supply
+            if record.get('annual_growth') is None:
+                row[idx['annual_growth']] = row[idx['expected_salary']] - row[idx['current_salary']]
+            if record.get('salary_growth_rate') is None:
+                row[idx['salary_growth_rate']] = row[idx['annual_growth']] / row[idx['current_salary']]
+            if record.get('tenure') is None:
+                row[idx['tenure']] = self._current_year - row[idx['joining_year']]
         
         return X
 
-if __name__ == "__main__":
+def main():
+    """Train and save all models"""
     trainer = WorkforceMLTrainer()
-    trainer.train_all_models()
\ No newline at end of file
+    trainer.train_all_models()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
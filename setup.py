@@ -34,6 +34,20 @@ def run_command(command, description):
     
     return True
 
+def run_in_process(func, description):
+    """Run a setup function in this interpreter and handle errors"""
+    print(f"Running: {description}")
+    
+    try:
+        func()
+    except Exception as e:
+        print(f"❌ {description} failed!")
+        print("Error:", e)
+        return False
+    
+    print(f"✅ {description} completed successfully!")
+    return True
+
 def check_python_version():
     """Check if Python version is compatible"""
     if sys.version_info < (3, 7):
@@ -78,10 +92,10 @@ def generate_training_data():
     """Generate synthetic training data"""
     print_step(3, 6, "Generating Training Data")
     
-    return run_command(
-        f"{sys.executable} data_generator.py",
-        "Generating synthetic employee and job data"
-    )
+    # Imported here, after dependencies are installed; runs without a new interpreter
+    from data_generator import main as generate_data
+    
+    return run_in_process(generate_data, "Generating synthetic employee and job data")
 
 def initialize_database():
     """Initialize the database"""
@@ -100,10 +114,9 @@ def train_ml_models():
     """Train machine learning models"""
     print_step(5, 6, "Training ML Models")
     
-    return run_command(
-        f"{sys.executable} -m ml_models.model_trainer",
-        "Training machine learning models"
-    )
+    from ml_models.model_trainer import main as train_models
+    
+    return run_in_process(train_models, "Training machine learning models")
 
 def verify_setup():
     """Verify that all components are working"""
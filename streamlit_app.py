@@ -3,9 +3,15 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import requests
 import json
+import os
+import io
+import contextlib
+import traceback
+import heapq
 from datetime import datetime
 import time
 
@@ -13,6 +19,57 @@ from config import JOB_ROLES, SKILL_CATEGORIES, SALARY_RANGES
 from ml_models.model_trainer import ModelPredictor
 from database.database import init_database
 
+# Resolve one theme for every figure, set after streamlit's own default is registered.
+# The template is serialized into every chart, so keep only the parts of plotly_white
+# that bar, pie and polar charts use (the full one is ~7KB of mostly unused trace
+# defaults); a fixed uirevision keeps zoom and legend state when reruns resend a chart
+_WHITE = pio.templates["plotly_white"]
+pio.templates["workforce"] = go.layout.Template(
+    data={"bar": _WHITE.data.bar, "pie": _WHITE.data.pie},
+    layout={
+        **{key: _WHITE.layout[key] for key in (
+            "colorway", "paper_bgcolor", "plot_bgcolor", "xaxis", "yaxis",
+            "polar", "hovermode", "title", "coloraxis"
+        )},
+        "font": {"color": _WHITE.layout.font.color, "size": 11},
+        "margin": {"l": 40, "r": 10, "t": 40, "b": 40},
+        "uirevision": "static"
+    }
+)
+pio.templates.default = "workforce"
+
+# Midpoint salary per role, in JOB_ROLES order, so every role is scored in one array op
+_ROLE_AVG = np.array([
+    (SALARY_RANGES.get(role, (50, 100))[0] + SALARY_RANGES.get(role, (50, 100))[1]) / 2 * 1000
+    for role in JOB_ROLES
+])
+
+# Education level codes, and the per-code score bonus and salary multiplier indexed by them
+_EDU_MAP = {"High School": 0, "Bachelors": 1, "Masters": 2, "PhD": 3}
+_EDU_BONUS = np.array([5, 15, 25, 30])
+_EDU_MULT = np.array([0.85, 1.0, 1.15, 1.3])
+
+# Static skill catalog aggregates
+_TOTAL_SKILLS = sum(len(skills) for skills in SKILL_CATEGORIES.values())
+_SKILLS_PER_CAT = {category: len(skills) for category, skills in SKILL_CATEGORIES.items()}
+_ALL_SKILLS = [skill for skills in SKILL_CATEGORIES.values() for skill in skills]
+
+# Dashboard quick-stat cards, all static, rendered as one flex row in one markdown call
+_METRIC_HTML = '<div class="metric-row">' + "".join(
+    f'<div class="metric-card"><h3>{label}</h3><h2>{value}</h2></div>'
+    for label, value in [
+        ("Available Roles", len(JOB_ROLES)),
+        ("Skill Categories", len(SKILL_CATEGORIES)),
+        ("Total Skills", _TOTAL_SKILLS),
+        ("System Status", "🟢 Active")
+    ]
+) + '</div>'
+
+# Salary range bounds in SALARY_RANGES order, for the dashboard chart
+_SALARY_ROLES = list(SALARY_RANGES)
+_MIN_SALARY = np.array([SALARY_RANGES[role][0] for role in _SALARY_ROLES]) * 1000
+_MAX_SALARY = np.array([SALARY_RANGES[role][1] for role in _SALARY_ROLES]) * 1000
+
 # Page configuration
 st.set_page_config(
     page_title="Workforce Distribution AI",
@@ -22,7 +79,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better UI
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -36,6 +93,13 @@ st.markdown("""
         border-radius: 0.5rem;
         border-left: 4px solid #1f77b4;
     }
+    .metric-row {
+        display: flex;
+        gap: 1rem;
+    }
+    .metric-row > div {
+        flex: 1;
+    }
     .prediction-result {
         background-color: #e8f4fd;
         padding: 1.5rem;
@@ -50,7 +114,17 @@ st.markdown("""
         margin: 0.5rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Emitted on every run on purpose: Streamlit drops any element a rerun doesn't
+# re-emit, so injecting this once per session would unstyle the page after the first click
+st.markdown(_CSS, unsafe_allow_html=True)
+
+# Initialize the database once per server process, not once per session
+@st.cache_resource(show_spinner="Initializing system...")
+def _db_init():
+    init_database()
+    return True
 
 # Initialize ML models
 @st.cache_resource
@@ -64,13 +138,8 @@ def load_models():
 def main():
     st.markdown('<h1 class="main-header">👥 Workforce Distribution AI</h1>', unsafe_allow_html=True)
     
-    # Initialize database and models
-    if 'initialized' not in st.session_state:
-        with st.spinner("Initializing system..."):
-            init_database()
-            st.session_state.initialized = True
-    
-    predictor = load_models()
+    # Initialize database; models load on the pages that predict
+    _db_init()
     
     # Sidebar navigation
     st.sidebar.title("🔍 Navigation")
@@ -83,53 +152,21 @@ def main():
     if page == "🏠 Dashboard":
         dashboard_page()
     elif page == "👤 Employee Assessment":
-        employee_assessment_page(predictor)
+        employee_assessment_page()
     elif page == "💼 Job Recommendations":
-        job_recommendations_page(predictor)
+        job_recommendations_page()
     elif page == "📊 Analytics":
         analytics_page()
     elif page == "⚙️ Model Training":
         model_training_page()
     elif page == "🎯 Skill Rating":
-        skill_rating_page(predictor)
+        skill_rating_page()
 
 def dashboard_page():
     st.header("📈 Workforce Overview Dashboard")
     
     # Quick stats
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>Available Roles</h3>
-            <h2>{}</h2>
-        </div>
-        """.format(len(JOB_ROLES)), unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>Skill Categories</h3>
-            <h2>{}</h2>
-        </div>
-        """.format(len(SKILL_CATEGORIES)), unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>Total Skills</h3>
-            <h2>{}</h2>
-        </div>
-        """.format(sum(len(skills) for skills in SKILL_CATEGORIES.values())), unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>System Status</h3>
-            <h2>🟢 Active</h2>
-        </div>
-        """.format(sum(len(skills) for skills in SKILL_CATEGORIES.values())), unsafe_allow_html=True)
+    st.markdown(_METRIC_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -138,31 +175,16 @@ def dashboard_page():
     
     with col1:
         st.subheader("💰 Salary Ranges by Role")
-        roles_df = pd.DataFrame([
-            {"Role": role, "Min Salary": ranges[0]*1000, "Max Salary": ranges[1]*1000}
-            for role, ranges in SALARY_RANGES.items()
-        ])
-        
-        fig = px.bar(roles_df, x="Role", y=["Min Salary", "Max Salary"],
-                    title="Salary Ranges by Job Role",
-                    barmode="group")
-        fig.update_layout(xaxis_tickangle=45)
-
-
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_salary_ranges_fig(), use_container_width=True, theme=None)
     
     with col2:
         st.subheader("🎯 Skills by Category")
-        skills_count = {category: len(skills) for category, skills in SKILL_CATEGORIES.items()}
-        
-        fig = px.pie(values=list(skills_count.values()), 
-                    names=list(skills_count.keys()),
-                    title="Distribution of Skills by Category")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_skills_pie_fig(), use_container_width=True, theme=None)
 
-def employee_assessment_page(predictor):
+def employee_assessment_page():
     st.header("👤 Employee Assessment & Predictions")
     
+    predictor = load_models()
     if predictor is None:
         st.error("⚠️ ML models are not available. Please run model training first.")
         return
@@ -198,16 +220,15 @@ def employee_assessment_page(predictor):
         }
         
         # Add derived features
-        education_map = {"High School": 0, "Bachelors": 1, "Masters": 2, "PhD": 3}
-        employee_data['education_encoded'] = education_map[education]
+        employee_data['education_encoded'] = _EDU_MAP[education]
         employee_data['annual_growth'] = expected_salary - current_salary
         employee_data['salary_growth_rate'] = employee_data['annual_growth'] / current_salary
-        employee_data['tenure'] = 2023 - joining_year
         
         with st.spinner("Generating predictions..."):
-            # Retention prediction
             try:
-                retention_result = predictor.predict_retention(employee_data)
+                # One feature build shared by all four models
+                results = predictor.predict_all(employee_data)
+                retention_result = results['retention']
                 
                 st.markdown("### 🎯 Prediction Results")
                 
@@ -227,7 +248,7 @@ def employee_assessment_page(predictor):
                     """, unsafe_allow_html=True)
                 
                 with col2:
-                    predicted_salary = predictor.predict_salary(employee_data)
+                    predicted_salary = results['salary']
                     growth = predicted_salary - current_salary
                     growth_pct = (growth / current_salary) * 100
                     
@@ -240,7 +261,7 @@ def employee_assessment_page(predictor):
                     """, unsafe_allow_html=True)
                 
                 with col3:
-                    role_result = predictor.predict_role(employee_data)
+                    role_result = results['role']
                     confidence_color = "🟢" if role_result['confidence'] > 0.8 else "🟡" if role_result['confidence'] > 0.6 else "🔴"
                     
                     st.markdown(f"""
@@ -252,7 +273,7 @@ def employee_assessment_page(predictor):
                     """, unsafe_allow_html=True)
                 
                 # Skill rating
-                skill_rating = predictor.predict_skill_rating(employee_data)
+                skill_rating = results['skill_rating']
                 
                 if skill_rating >= 8:
                     skill_level = "Expert 🎓"
@@ -278,7 +299,7 @@ def employee_assessment_page(predictor):
             except Exception as e:
                 st.error(f"Prediction error: {e}")
 
-def job_recommendations_page(predictor):
+def job_recommendations_page():
     st.header("💼 Job Role Recommendations")
     
     st.markdown("### Employee Profile for Job Matching")
@@ -311,28 +332,30 @@ def job_recommendations_page(predictor):
         
         st.markdown("### 🎯 Top Job Recommendations")
         
-        recommendations = []
-        education_map = {"High School": 0, "Bachelors": 1, "Masters": 2, "PhD": 3}
-        employee_data['education_encoded'] = education_map[education]
+        employee_data['education_encoded'] = _EDU_MAP[education]
         
-        for role in JOB_ROLES:
-            match_score = calculate_match_score(employee_data, role)
-            salary_estimate = estimate_salary_for_role(employee_data, role)
-            
-            recommendations.append({
-                "Role": role,
-                "Match Score": match_score,
-                "Estimated Salary": salary_estimate,
-                "Salary Range": f"${SALARY_RANGES[role][0]}k - ${SALARY_RANGES[role][1]}k"
-            })
+        match_scores = calculate_match_scores(employee_data)
+        salary_estimates = estimate_salaries_for_roles(employee_data)
         
-        recommendations.sort(key=lambda x: x['Match Score'], reverse=True)
+        # Partial top-10 selection; nlargest keeps tied roles in JOB_ROLES order like a stable sort,
+        # and only the shown roles become dicts
+        top_indices = heapq.nlargest(10, range(len(JOB_ROLES)), key=match_scores.__getitem__)
+        recommendations = [
+            {
+                "Role": JOB_ROLES[i],
+                "Match Score": float(match_scores[i]),
+                "Estimated Salary": float(salary_estimates[i]),
+                "Salary Range": f"${SALARY_RANGES[JOB_ROLES[i]][0]}k - ${SALARY_RANGES[JOB_ROLES[i]][1]}k"
+            }
+            for i in top_indices
+        ]
         
-        # Display top 5 recommendations
+        # Display top 5 recommendations, joined into one markdown element
+        card_html = []
         for i, rec in enumerate(recommendations[:5]):
             match_color = "#28a745" if rec['Match Score'] >= 80 else "#007bff" if rec['Match Score'] >= 60 else "#ffc107"
             
-            st.markdown(f"""
+            card_html.append(f"""
             <div class="recommendation-card">
                 <div style="display: flex; justify-content: space-between; align-items: center;">
                     <div>
@@ -346,62 +369,37 @@ def job_recommendations_page(predictor):
                     </div>
                 </div>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+        st.markdown("".join(card_html), unsafe_allow_html=True)
         
         # Visualization
-        rec_df = pd.DataFrame(recommendations[:10])
-        fig = px.bar(rec_df, x="Match Score", y="Role", orientation='h',
+        rec_data = {
+            "Role": [rec["Role"] for rec in recommendations],
+            "Match Score": [rec["Match Score"] for rec in recommendations]
+        }
+        fig = px.bar(rec_data, x="Match Score", y="Role", orientation='h',
                     title="Job Role Match Scores",
                     color="Match Score",
                     color_continuous_scale="Viridis")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, theme=None)
 
 def analytics_page():
     st.header("📊 Workforce Analytics")
     
-    # Generate sample data for visualization
-    np.random.seed(42)
-    
     # Role distribution
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("Role Distribution")
-        role_counts = {role: np.random.randint(5, 50) for role in JOB_ROLES}
-        
-        fig = px.pie(values=list(role_counts.values()), 
-                    names=list(role_counts.keys()),
-                    title="Current Workforce Distribution")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_role_distribution_fig(42), use_container_width=True, theme=None)
     
     with col2:
         st.subheader("Salary Analysis")
-        salary_data = []
-        for role in JOB_ROLES[:8]:  # Top 8 roles for clarity
-            min_sal, max_sal = SALARY_RANGES[role]
-            avg_sal = (min_sal + max_sal) / 2 * 1000
-            salary_data.append({"Role": role, "Average Salary": avg_sal})
-        
-        salary_df = pd.DataFrame(salary_data)
-        fig = px.bar(salary_df, x="Role", y="Average Salary",
-                    title="Average Salary by Role")
-        fig.update_layout(xaxis_tickangle=45)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_average_salary_fig(), use_container_width=True, theme=None)
     
     # Skill demand analysis
     st.subheader("Skill Demand Analysis")
-    
-    skill_demand = {}
-    for category, skills in SKILL_CATEGORIES.items():
-        for skill in skills:
-            skill_demand[skill] = np.random.randint(10, 100)
-    
-    # Top 15 skills
-    top_skills = dict(sorted(skill_demand.items(), key=lambda x: x[1], reverse=True)[:15])
-    
-    fig = px.bar(x=list(top_skills.values()), y=list(top_skills.keys()),
-                orientation='h', title="Top Skills in Demand")
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(_top_skills_fig(42), use_container_width=True, theme=None)
 
 def model_training_page():
     st.header("⚙️ ML Model Training & Management")
@@ -420,52 +418,36 @@ def model_training_page():
     with col1:
         if st.button("📊 Generate Training Data", type="secondary"):
             with st.spinner("Generating synthetic training data..."):
-                import subprocess
-                result = subprocess.run(["python", "data_generator.py"], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
+                from data_generator import main as generate_data_main
+                ok, output = _run_captured(generate_data_main)
+                if ok:
                     st.success("✅ Training data generated successfully!")
-                    st.code(result.stdout)
+                    _model_status_rows.clear()
+                    st.code(output)
                 else:
                     st.error("❌ Error generating data:")
-                    st.code(result.stderr)
+                    st.code(output)
     
     with col2:
         if st.button("🤖 Train ML Models", type="primary"):
             with st.spinner("Training machine learning models..."):
-                import subprocess
-                result = subprocess.run(["python", "-m", "ml_models.model_trainer"], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
+                from ml_models.model_trainer import main as train_models_main
+                ok, output = _run_captured(train_models_main)
+                if ok:
                     st.success("✅ Models trained successfully!")
-                    st.code(result.stdout)
+                    _model_status_rows.clear()
+                    load_models.clear()
+                    st.code(output)
                     st.balloons()
                 else:
                     st.error("❌ Error training models:")
-                    st.code(result.stderr)
+                    st.code(output)
     
     # Model status
     st.markdown("### 📈 Model Status")
-    import os
-    
-    models_status = []
-    model_files = [
-        ("Retention Model", "models/retention_model.pkl"),
-        ("Salary Model", "models/salary_model.pkl"),
-        ("Role Classifier", "models/role_model.pkl"),
-        ("Skill Rating", "models/skill_rating_model.pkl"),
-        ("Encoders", "models/encoders.pkl"),
-        ("Data Imputer", "models/imputer.pkl")
-    ]
-    
-    for name, path in model_files:
-        status = "✅ Available" if os.path.exists(path) else "❌ Missing"
-        size = f"{os.path.getsize(path) / 1024:.1f} KB" if os.path.exists(path) else "N/A"
-        models_status.append({"Model": name, "Status": status, "Size": size})
-    
-    st.dataframe(pd.DataFrame(models_status), use_container_width=True)
+    st.dataframe(_model_status_rows(), use_container_width=True)
 
-def skill_rating_page(predictor):
+def skill_rating_page():
     st.header("🎯 Employee Skill Rating System")
     
     st.markdown("""
@@ -473,6 +455,7 @@ def skill_rating_page(predictor):
     Evaluate employee skills across different categories and get detailed ratings.
     """)
     
+    predictor = load_models()
     if predictor is None:
         st.error("⚠️ ML models are not available. Please train models first.")
         return
@@ -498,12 +481,10 @@ def skill_rating_page(predictor):
         )
     
     if st.button("📊 Generate Skill Assessment", type="primary"):
-        education_map = {"High School": 0, "Bachelors": 1, "Masters": 2, "PhD": 3}
-        
         employee_data = {
             "age": age,
             "experience_in_domain": experience,
-            "education_encoded": education_map[education],
+            "education_encoded": _EDU_MAP[education],
             "performance_rating": performance,
             "current_salary": current_salary,
             "payment_tier": payment_tier
@@ -526,47 +507,27 @@ def skill_rating_page(predictor):
         # Category-wise ratings
         st.markdown("### 🔍 Category-wise Skill Breakdown")
         
-        category_ratings = {}
-        for category in selected_categories:
-            # Simulate category-specific rating based on overall rating
-            category_modifier = np.random.normal(0, 0.5)
-            cat_rating = max(1, min(10, overall_rating + category_modifier))
-            category_ratings[category] = cat_rating
+        # Simulate category-specific ratings based on the overall rating, one draw for all categories
+        rng = np.random.default_rng()
+        category_modifiers = rng.normal(0.0, 0.5, size=len(selected_categories))
+        cat_ratings = np.clip(overall_rating + category_modifiers, 1.0, 10.0)
+        category_ratings = dict(zip(selected_categories, cat_ratings.tolist()))
         
-        cols = st.columns(len(selected_categories))
-        for i, (category, rating) in enumerate(category_ratings.items()):
-            with cols[i]:
-                rating_color = "#28a745" if rating >= 8 else "#007bff" if rating >= 6 else "#ffc107" if rating >= 4 else "#dc3545"
-                
-                st.markdown(f"""
-                <div style="text-align: center; padding: 1.5rem; background-color: #f8f9fa; border-radius: 0.5rem;">
-                    <h4>{category}</h4>
-                    <h2 style="color: {rating_color}; margin: 0;">{rating:.1f}/10</h2>
-                </div>
-                """, unsafe_allow_html=True)
+        # One flex row of cards instead of a column container and markdown call per category
+        card_html = []
+        for category, rating in category_ratings.items():
+            rating_color = "#28a745" if rating >= 8 else "#007bff" if rating >= 6 else "#ffc107" if rating >= 4 else "#dc3545"
+            
+            card_html.append(f"""
+            <div style="text-align: center; padding: 1.5rem; background-color: #f8f9fa; border-radius: 0.5rem;">
+                <h4>{category}</h4>
+                <h2 style="color: {rating_color}; margin: 0;">{rating:.1f}/10</h2>
+            </div>""")
+        st.markdown(f'<div class="metric-row">{"".join(card_html)}</div>', unsafe_allow_html=True)
         
         # Skills radar chart
         if len(selected_categories) > 2:
-            fig = go.Figure()
-            
-            fig.add_trace(go.Scatterpolar(
-                r=list(category_ratings.values()),
-                theta=list(category_ratings.keys()),
-                fill='toself',
-                name='Skill Ratings'
-            ))
-            
-            fig.update_layout(
-                polar=dict(
-                    radialaxis=dict(
-                        visible=True,
-                        range=[0, 10]
-                    )),
-                showlegend=True,
-                title="Skill Category Radar Chart"
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(_radar_fig(tuple(category_ratings.items())), use_container_width=True, theme=None)
         
         # Recommendations
         st.markdown("### 💡 Development Recommendations")
@@ -581,9 +542,135 @@ def skill_rating_page(predictor):
             else:
                 st.success(f"**{category}**: Excellent skills! Consider mentoring others and staying current with: {', '.join(skills_in_category[-3:])}")
 
+# Cached chart builders; their inputs are static config or seeded sample data,
+# so reruns reuse the figures instead of rebuilding them
+@st.cache_data
+def _salary_ranges_fig():
+    # Plain traces from the arrays; px.bar would build and melt a DataFrame first
+    fig = go.Figure([
+        go.Bar(name="Min Salary", x=_SALARY_ROLES, y=_MIN_SALARY),
+        go.Bar(name="Max Salary", x=_SALARY_ROLES, y=_MAX_SALARY)
+    ])
+    fig.update_layout(title="Salary Ranges by Job Role", barmode="group",
+                      xaxis_title="Role", yaxis_title="Salary", xaxis_tickangle=45)
+    return fig
+
+@st.cache_data
+def _skills_pie_fig():
+    return px.pie(values=list(_SKILLS_PER_CAT.values()), 
+                 names=list(_SKILLS_PER_CAT.keys()),
+                 title="Distribution of Skills by Category")
+
+@st.cache_data
+def _sample_workforce_data(seed):
+    """Generate sample role counts and skill demand for the analytics page"""
+    rng = np.random.default_rng(seed)
+    
+    # One vectorised draw per table instead of one RNG call per role/skill
+    role_counts = dict(zip(JOB_ROLES, rng.integers(5, 50, size=len(JOB_ROLES)).tolist()))
+    
+    skill_demand = rng.integers(10, 100, size=len(_ALL_SKILLS))
+    
+    # Top 15 skills; the stable sort keeps catalog order among ties, as sorted() did
+    top_idx = np.argsort(-skill_demand, kind="stable")[:15]
+    top_skills = {_ALL_SKILLS[i]: int(skill_demand[i]) for i in top_idx}
+    
+    return role_counts, top_skills
+
+@st.cache_data
+def _role_distribution_fig(seed):
+    role_counts, _ = _sample_workforce_data(seed)
+    
+    return px.pie(values=list(role_counts.values()), 
+                 names=list(role_counts.keys()),
+                 title="Current Workforce Distribution")
+
+@st.cache_data
+def _average_salary_fig():
+    roles = JOB_ROLES[:8]  # Top 8 roles for clarity
+    salary_data = {
+        "Role": roles,
+        "Average Salary": [(SALARY_RANGES[role][0] + SALARY_RANGES[role][1]) / 2 * 1000 for role in roles]
+    }
+    
+    fig = px.bar(salary_data, x="Role", y="Average Salary",
+                title="Average Salary by Role")
+    fig.update_layout(xaxis_tickangle=45)
+    return fig
+
+@st.cache_data
+def _top_skills_fig(seed):
+    _, top_skills = _sample_workforce_data(seed)
+    
+    return px.bar(x=list(top_skills.values()), y=list(top_skills.keys()),
+                 orientation='h', title="Top Skills in Demand")
+
+# Keyed on the rating values, which are noisy floats, so keep the cache bounded
+@st.cache_data(max_entries=32)
+def _radar_fig(category_items):
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatterpolar(
+        r=[rating for _, rating in category_items],
+        theta=[category for category, _ in category_items],
+        fill='toself',
+        name='Skill Ratings'
+    ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 10]
+            )),
+        showlegend=True,
+        title="Skill Category Radar Chart"
+    )
+    
+    return fig
+
+_MODEL_FILES = [
+    ("Retention Model", "models/retention_model.pkl"),
+    ("Salary Model", "models/salary_model.pkl"),
+    ("Role Classifier", "models/role_model.pkl"),
+    ("Skill Rating", "models/skill_rating_model.pkl"),
+    ("Encoders", "models/encoders.pkl"),
+    ("Data Imputer", "models/imputer.pkl")
+]
+
+@st.cache_data(ttl=30)
+def _model_status_rows():
+    """Availability and size of each model file, refreshed at most every 30 seconds"""
+    models_status = []
+    
+    for name, path in _MODEL_FILES:
+        # One stat() answers both existence and size
+        try:
+            size = f"{os.stat(path).st_size / 1024:.1f} KB"
+            status = "✅ Available"
+        except FileNotFoundError:
+            size = "N/A"
+            status = "❌ Missing"
+        models_status.append({"Model": name, "Status": status, "Size": size})
+    
+    # st.dataframe takes the rows as they are
+    return models_status
+
 # Helper functions
-def calculate_match_score(employee_data, role):
-    """Calculate job match score"""
+def _run_captured(func):
+    """Run a pipeline entry point in this process, returning (ok, captured output)"""
+    buf = io.StringIO()
+    
+    try:
+        with contextlib.redirect_stdout(buf):
+            func()
+    except Exception:
+        return False, buf.getvalue() + traceback.format_exc()
+    
+    return True, buf.getvalue()
+
+def calculate_match_scores(employee_data):
+    """Calculate job match scores for every role in JOB_ROLES"""
     score = 0.0
     
     experience = employee_data.get('experience_in_domain', 0)
@@ -594,37 +681,28 @@ def calculate_match_score(employee_data, role):
     else:
         score += 10
     
-    education_bonus = {0: 5, 1: 15, 2: 25, 3: 30}
-    score += education_bonus.get(employee_data.get('education_encoded', 1), 15)
+    score += _EDU_BONUS[employee_data.get('education_encoded', 1)]
     
     performance = employee_data.get('performance_rating', 5)
     score += (performance / 10) * 25
     
     current_salary = employee_data.get('current_salary', 50000)
-    role_salary_range = SALARY_RANGES.get(role, (50, 100))
-    role_avg_salary = (role_salary_range[0] + role_salary_range[1]) / 2 * 1000
+    salary_alignment = 1 - np.abs(current_salary - _ROLE_AVG) / _ROLE_AVG
+    scores = score + np.maximum(0, salary_alignment * 20)
     
-    salary_alignment = 1 - abs(current_salary - role_avg_salary) / role_avg_salary
-    score += max(0, salary_alignment * 20)
-    
-    return min(100, max(0, score))
+    return np.clip(scores, 0, 100)
 
-def estimate_salary_for_role(employee_data, role):
-    """Estimate salary for role"""
-    base_salary_range = SALARY_RANGES.get(role, (50, 100))
-    base_salary = (base_salary_range[0] + base_salary_range[1]) / 2 * 1000
-    
+def estimate_salaries_for_roles(employee_data):
+    """Estimate salary for every role in JOB_ROLES"""
     experience = employee_data.get('experience_in_domain', 0)
     exp_multiplier = 1 + (experience * 0.03)
     
-    edu_multipliers = {0: 0.85, 1: 1.0, 2: 1.15, 3: 1.3}
-    edu_multiplier = edu_multipliers.get(employee_data.get('education_encoded', 1), 1.0)
+    edu_multiplier = _EDU_MULT[employee_data.get('education_encoded', 1)]
     
     performance = employee_data.get('performance_rating', 7)
     perf_multiplier = 0.8 + (performance / 10) * 0.4
     
-    estimated_salary = base_salary * exp_multiplier * edu_multiplier * perf_multiplier
-    return estimated_salary
+    return _ROLE_AVG * exp_multiplier * edu_multiplier * perf_multiplier
 
 if __name__ == "__main__":
     main()